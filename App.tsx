@@ -1,11 +1,19 @@
-import React, { useState } from 'react';
+import React, { useState, useCallback, lazy, Suspense } from 'react';
 import { Ship, Database, Brain, User, BarChart3 } from 'lucide-react';
-import { TitanicPassenger } from './types/titanic';
+import { TitanicPassenger, FeatureStats } from './types/titanic';
 import { DataUpload } from './components/DataUpload';
-import { DataAnalysis } from './components/DataAnalysis';
-import { ModelTraining } from './components/ModelTraining';
-import { PredictionForm } from './components/PredictionForm';
-import { LogisticRegression, RandomForest } from './utils/mlModels';
+import type { LogisticRegression, RandomForest } from './utils/mlModels';
+
+// Later tabs (and the ML code they pull in) load on first visit
+const DataAnalysis = lazy(() =>
+  import('./components/DataAnalysis').then(m => ({ default: m.DataAnalysis }))
+);
+const ModelTraining = lazy(() =>
+  import('./components/ModelTraining').then(m => ({ default: m.ModelTraining }))
+);
+const PredictionForm = lazy(() =>
+  import('./components/PredictionForm').then(m => ({ default: m.PredictionForm }))
+);
 
 type TabType = 'upload' | 'analysis' | 'training' | 'prediction';
 
@@ -14,6 +22,7 @@ function App() {
   const [data, setData] = useState<TitanicPassenger[]>([]);
   const [trainedModel, setTrainedModel] = useState<LogisticRegression | RandomForest | null>(null);
   const [modelType, setModelType] = useState<string>('');
+  const [featureStats, setFeatureStats] = useState<FeatureStats | null>(null);
   const [error, setError] = useState<string>('');
 
   const handleDataLoaded = (newData: TitanicPassenger[]) => {
@@ -26,10 +35,12 @@ function App() {
     setError(errorMessage);
   };
 
-  const handleModelTrained = (model: LogisticRegression | RandomForest, type: string) => {
+  // Stable identity so ModelTraining's effect only fires when the selection changes
+  const handleModelTrained = useCallback((model: LogisticRegression | RandomForest, type: string, stats: FeatureStats) => {
     setTrainedModel(model);
     setModelType(type);
-  };
+    setFeatureStats(stats);
+  }, []);
 
   const tabs = [
     { id: 'upload', name: 'Data Upload', icon: Database, disabled: false },
@@ -113,17 +124,25 @@ function App() {
           <DataUpload onDataLoaded={handleDataLoaded} onError={handleError} />
         )}
         
-        {activeTab === 'analysis' && data.length > 0 && (
-          <DataAnalysis data={data} />
-        )}
-        
-        {activeTab === 'training' && data.length > 0 && (
-          <ModelTraining data={data} onModelTrained={handleModelTrained} />
-        )}
-        
-        {activeTab === 'prediction' && (
-          <PredictionForm model={trainedModel} modelType={modelType} />
-        )}
+        <Suspense
+          fallback={
+            <div className="flex justify-center py-12">
+              <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-indigo-600"></div>
+            </div>
+          }
+        >
+          {activeTab === 'analysis' && data.length > 0 && (
+            <DataAnalysis data={data} />
+          )}
+          
+          {activeTab === 'training' && data.length > 0 && (
+            <ModelTraining data={data} onModelTrained={handleModelTrained} />
+          )}
+          
+          {activeTab === 'prediction' && (
+            <PredictionForm model={trainedModel} modelType={modelType} featureStats={featureStats} />
+          )}
+        </Suspense>
       </main>
 
       {/* Footer */}
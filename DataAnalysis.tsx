@@ -1,5 +1,6 @@
 import React from 'react';
 import { TitanicPassenger } from '../types/titanic';
+import { DataAnalyzer } from '../utils/dataAnalyzer';
 import { BarChart3, Users, Percent, TrendingUp } from 'lucide-react';
 
 interface DataAnalysisProps {
@@ -7,47 +8,14 @@ interface DataAnalysisProps {
 }
 
 export const DataAnalysis: React.FC<DataAnalysisProps> = ({ data }) => {
-  const totalPassengers = data.length;
-  const survivedCount = data.filter(p => p.Survived === 1).length;
-  const survivalRate = totalPassengers > 0 ? (survivedCount / totalPassengers * 100).toFixed(1) : '0';
-  
-  const classSurvival = [1, 2, 3].map(pclass => {
-    const classPassengers = data.filter(p => p.Pclass === pclass);
-    const classSurvived = classPassengers.filter(p => p.Survived === 1).length;
-    return {
-      class: pclass,
-      total: classPassengers.length,
-      survived: classSurvived,
-      rate: classPassengers.length > 0 ? (classSurvived / classPassengers.length * 100).toFixed(1) : '0'
-    };
-  });
-
-  const genderSurvival = ['male', 'female'].map(gender => {
-    const genderPassengers = data.filter(p => p.Sex === gender);
-    const genderSurvived = genderPassengers.filter(p => p.Survived === 1).length;
-    return {
-      gender,
-      total: genderPassengers.length,
-      survived: genderSurvived,
-      rate: genderPassengers.length > 0 ? (genderSurvived / genderPassengers.length * 100).toFixed(1) : '0'
-    };
-  });
-
-  const ageGroups = [
-    { name: 'Children (0-12)', min: 0, max: 12 },
-    { name: 'Teenagers (13-19)', min: 13, max: 19 },
-    { name: 'Adults (20-59)', min: 20, max: 59 },
-    { name: 'Elderly (60+)', min: 60, max: 150 }
-  ].map(group => {
-    const groupPassengers = data.filter(p => p.Age !== null && p.Age >= group.min && p.Age <= group.max);
-    const groupSurvived = groupPassengers.filter(p => p.Survived === 1).length;
-    return {
-      ...group,
-      total: groupPassengers.length,
-      survived: groupSurvived,
-      rate: groupPassengers.length > 0 ? (groupSurvived / groupPassengers.length * 100).toFixed(1) : '0'
-    };
-  });
+  const {
+    totalPassengers,
+    survivedCount,
+    survivalRate,
+    classSurvival,
+    genderSurvival,
+    ageGroups
+  } = DataAnalyzer.generateReport(data);
 
   return (
     <div className="bg-white rounded-lg shadow-lg p-6">
@@ -20,29 +20,33 @@ export const DataUpload: React.FC<DataUploadProps> = ({ onDataLoaded, onError })
 
     const reader = new FileReader();
     reader.onload = (e) => {
+      // Only parsing failures are reported as format errors; anything thrown
+      // while handing the data to the app should surface as a real error
+      let data: TitanicPassenger[];
       try {
         const csvText = e.target?.result as string;
-        const data = CSVParser.parseCSV(csvText);
-        
-        if (data.length === 0) {
-          onError('The CSV file appears to be empty');
-          return;
-        }
-
-        // Validate required columns
-        const requiredColumns = ['PassengerId', 'Pclass', 'Name', 'Sex', 'Age', 'SibSp', 'Parch', 'Fare', 'Embarked'];
-        const firstRow = data[0];
-        const missingColumns = requiredColumns.filter(col => !(col in firstRow));
-        
-        if (missingColumns.length > 0) {
-          onError(`Missing required columns: ${missingColumns.join(', ')}`);
-          return;
-        }
-
-        onDataLoaded(data);
+        data = CSVParser.parseCSV(csvText);
       } catch (error) {
         onError('Error parsing CSV file. Please check the file format.');
+        return;
       }
+      
+      if (data.length === 0) {
+        onError('The CSV file appears to be empty');
+        return;
+      }
+
+      // Validate required columns
+      const requiredColumns = ['PassengerId', 'Pclass', 'Name', 'Sex', 'Age', 'SibSp', 'Parch', 'Fare', 'Embarked'];
+      const firstRow = data[0];
+      const missingColumns = requiredColumns.filter(col => !(col in firstRow));
+      
+      if (missingColumns.length > 0) {
+        onError(`Missing required columns: ${missingColumns.join(', ')}`);
+        return;
+      }
+
+      onDataLoaded(data);
     };
 
     reader.onerror = () => {
@@ -1,12 +1,12 @@
-import React, { useState, useEffect } from 'react';
-import { TitanicPassenger, ProcessedPassenger, ModelMetrics } from '../types/titanic';
+import React, { useState, useEffect, useMemo } from 'react';
+import { TitanicPassenger, ProcessedPassenger, ModelMetrics, FeatureStats } from '../types/titanic';
 import { DataProcessor } from '../utils/dataProcessor';
 import { LogisticRegression, RandomForest } from '../utils/mlModels';
 import { Brain, Zap, Target, TrendingUp, CheckCircle, AlertCircle } from 'lucide-react';
 
 interface ModelTrainingProps {
   data: TitanicPassenger[];
-  onModelTrained: (model: LogisticRegression | RandomForest, modelType: string) => void;
+  onModelTrained: (model: LogisticRegression | RandomForest, modelType: string, featureStats: FeatureStats) => void;
 }
 
 export const ModelTraining: React.FC<ModelTrainingProps> = ({ data, onModelTrained }) => {
@@ -17,14 +17,23 @@ export const ModelTraining: React.FC<ModelTrainingProps> = ({ data, onModelTrain
   }>({});
   const [selectedModel, setSelectedModel] = useState<'logistic' | 'randomForest'>('logistic');
 
+  // Process the data once per dataset so retraining skips preprocessing
+  const { data: normalizedData, stats: featureStats } = useMemo(
+    () => DataProcessor.preparePassengers(data),
+    [data]
+  );
+
+  // Logistic regression trains on the main thread, so wait until a frame with
+  // the progress state has been committed before blocking it
+  const yieldToBrowser = () =>
+    new Promise<void>(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)));
+
   const trainModels = async () => {
     setIsTraining(true);
     
     try {
-      // Process the data
-      const processedData = DataProcessor.processPassengers(data);
-      const normalizedData = DataProcessor.normalizeFeatures(processedData);
-      
+      await yieldToBrowser();
+
       // Filter out data without survival information for training
       const trainingData = normalizedData.filter(p => p.Survived !== undefined);
       
@@ -33,19 +42,27 @@ export const ModelTraining: React.FC<ModelTrainingProps> = ({ data, onModelTrain
       }
 
       // Split data (80% train, 20% test)
-      const shuffled = [...trainingData].sort(() => Math.random() - 0.5);
+      // Fisher-Yates shuffle: one linear pass with an unbiased ordering,
+      // unlike sorting with a random comparator
+      const shuffled = [...trainingData];
+      for (let i = shuffled.length - 1; i > 0; i--) {
+        const j = Math.floor(Math.random() * (i + 1));
+        [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+      }
       const splitIndex = Math.floor(shuffled.length * 0.8);
       const trainSet = shuffled.slice(0, splitIndex);
       const testSet = shuffled.slice(splitIndex);
 
-      // Train Logistic Regression
+      // Start fitting the Random Forest's trees in Web Workers
+      const randomForestModel = new RandomForest();
+      const randomForestTraining = randomForestModel.trainParallel(trainSet);
+
+      // Train Logistic Regression here while the workers run
       const logisticModel = new LogisticRegression();
       logisticModel.train(trainSet);
       const logisticMetrics = logisticModel.evaluate(testSet);
 
-      // Train Random Forest
-      const randomForestModel = new RandomForest();
-      randomForestModel.train(trainSet);
+      await randomForestTraining;
       const randomForestMetrics = randomForestModel.evaluate(testSet);
 
       setTrainedModels({
@@ -64,19 +81,16 @@ export const ModelTraining: React.FC<ModelTrainingProps> = ({ data, onModelTrain
     }
   };
 
+  // The effect below reports the selected model to the parent
   const handleModelSelection = (modelType: 'logistic' | 'randomForest') => {
     setSelectedModel(modelType);
-    const selectedModelData = trainedModels[modelType];
-    if (selectedModelData) {
-      onModelTrained(selectedModelData.model, modelType);
-    }
   };
 
   useEffect(() => {
     if (trainedModels[selectedModel]) {
-      onModelTrained(trainedModels[selectedModel]!.model, selectedModel);
+      onModelTrained(trainedModels[selectedModel]!.model, selectedModel, featureStats);
     }
-  }, [selectedModel, trainedModels, onModelTrained]);
+  }, [selectedModel, trainedModels, featureStats, onModelTrained]);
 
   const formatMetric = (value: number) => (value * 100).toFixed(1) + '%';
 
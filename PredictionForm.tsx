@@ -1,15 +1,16 @@
 import React, { useState } from 'react';
 import { User, Ship, AlertCircle, CheckCircle, XCircle } from 'lucide-react';
-import { TitanicPassenger, PredictionResult } from '../types/titanic';
+import { TitanicPassenger, PredictionResult, FeatureStats } from '../types/titanic';
 import { DataProcessor } from '../utils/dataProcessor';
 import { LogisticRegression, RandomForest } from '../utils/mlModels';
 
 interface PredictionFormProps {
   model: LogisticRegression | RandomForest | null;
   modelType: string;
+  featureStats: FeatureStats | null;
 }
 
-export const PredictionForm: React.FC<PredictionFormProps> = ({ model, modelType }) => {
+export const PredictionForm: React.FC<PredictionFormProps> = ({ model, modelType, featureStats }) => {
   const [formData, setFormData] = useState({
     name: '',
     pclass: 3,
@@ -54,9 +55,8 @@ export const PredictionForm: React.FC<PredictionFormProps> = ({ model, modelType
         Embarked: formData.embarked
       };
 
-      // Process the passenger data
-      const processed = DataProcessor.processPassengers([passenger]);
-      const normalized = DataProcessor.normalizeFeatures(processed);
+      // Process the passenger data with the training set's scaling
+      const { data: normalized } = DataProcessor.preparePassengers([passenger], featureStats ?? undefined);
       
       // Make prediction
       const result = model.predict(normalized[0]);
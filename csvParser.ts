@@ -4,6 +4,8 @@ export class CSVParser {
   static parseCSV(csvText: string): TitanicPassenger[] {
     const lines = csvText.trim().split('\n');
     const headers = lines[0].split(',').map(h => h.trim().replace(/"/g, ''));
+    // Resolve each column's type once from the header instead of per cell
+    const columnTypes = headers.map(header => this.getColumnType(header));
     
     return lines.slice(1).map(line => {
       const values = this.parseCSVLine(line);
@@ -13,9 +15,9 @@ export class CSVParser {
         let value: any = values[index]?.trim().replace(/"/g, '');
         
         // Convert numeric fields
-        if (['PassengerId', 'Survived', 'Pclass', 'SibSp', 'Parch'].includes(header)) {
+        if (columnTypes[index] === 'int') {
           passenger[header] = value ? parseInt(value) : 0;
-        } else if (['Age', 'Fare'].includes(header)) {
+        } else if (columnTypes[index] === 'float') {
           passenger[header] = value && value !== '' ? parseFloat(value) : null;
         } else {
           passenger[header] = value || '';
@@ -26,25 +28,39 @@ export class CSVParser {
     });
   }
 
+  private static getColumnType(header: string): 'int' | 'float' | 'string' {
+    if (['PassengerId', 'Survived', 'Pclass', 'SibSp', 'Parch'].includes(header)) {
+      return 'int';
+    }
+    if (['Age', 'Fare'].includes(header)) {
+      return 'float';
+    }
+    return 'string';
+  }
+
   private static parseCSVLine(line: string): string[] {
     const result: string[] = [];
     let current = '';
     let inQuotes = false;
+    // Start of the pending run of plain characters, copied with one slice
+    // instead of appending character by character
+    let segmentStart = 0;
     
     for (let i = 0; i < line.length; i++) {
       const char = line[i];
       
       if (char === '"') {
+        current += line.slice(segmentStart, i);
+        segmentStart = i + 1;
         inQuotes = !inQuotes;
       } else if (char === ',' && !inQuotes) {
-        result.push(current);
+        result.push(current + line.slice(segmentStart, i));
         current = '';
-      } else {
-        current += char;
+        segmentStart = i + 1;
       }
     }
     
-    result.push(current);
+    result.push(current + line.slice(segmentStart));
     return result;
   }
 
@@ -0,0 +1,82 @@
+import { TitanicPassenger, SurvivalReport } from '../types/titanic';
+
+export class DataAnalyzer {
+  // Reports are cached per dataset so revisiting the Analysis tab is free
+  private static reportCache = new WeakMap<TitanicPassenger[], SurvivalReport>();
+
+  private static ageGroupRanges = [
+    { name: 'Children (0-12)', min: 0, max: 12 },
+    { name: 'Teenagers (13-19)', min: 13, max: 19 },
+    { name: 'Adults (20-59)', min: 20, max: 59 },
+    { name: 'Elderly (60+)', min: 60, max: 150 }
+  ];
+
+  private static genders = ['male', 'female'];
+
+  static formatRate(survived: number, total: number): string {
+    return total > 0 ? (survived / total * 100).toFixed(1) : '0';
+  }
+
+  static generateReport(data: TitanicPassenger[]): SurvivalReport {
+    const cached = this.reportCache.get(data);
+    if (cached) return cached;
+
+    const ageGroupRanges = this.ageGroupRanges;
+    const genders = this.genders;
+
+    // Tally every breakdown in a single pass over the passengers
+    const classCounts = [1, 2, 3].map(() => ({ total: 0, survived: 0 }));
+    const genderCounts = genders.map(() => ({ total: 0, survived: 0 }));
+    const ageGroupCounts = ageGroupRanges.map(() => ({ total: 0, survived: 0 }));
+    let survivedCount = 0;
+
+    data.forEach(p => {
+      const survived = p.Survived === 1 ? 1 : 0;
+      survivedCount += survived;
+
+      const classCount = classCounts[p.Pclass - 1];
+      if (classCount) {
+        classCount.total++;
+        classCount.survived += survived;
+      }
+
+      const genderCount = genderCounts[genders.indexOf(p.Sex)];
+      if (genderCount) {
+        genderCount.total++;
+        genderCount.survived += survived;
+      }
+
+      if (p.Age !== null) {
+        const groupIndex = ageGroupRanges.findIndex(group => p.Age! >= group.min && p.Age! <= group.max);
+        if (groupIndex !== -1) {
+          ageGroupCounts[groupIndex].total++;
+          ageGroupCounts[groupIndex].survived += survived;
+        }
+      }
+    });
+
+    const report: SurvivalReport = {
+      totalPassengers: data.length,
+      survivedCount,
+      survivalRate: this.formatRate(survivedCount, data.length),
+      classSurvival: classCounts.map((counts, index) => ({
+        class: index + 1,
+        ...counts,
+        rate: this.formatRate(counts.survived, counts.total)
+      })),
+      genderSurvival: genderCounts.map((counts, index) => ({
+        gender: genders[index],
+        ...counts,
+        rate: this.formatRate(counts.survived, counts.total)
+      })),
+      ageGroups: ageGroupRanges.map((group, index) => ({
+        ...group,
+        ...ageGroupCounts[index],
+        rate: this.formatRate(ageGroupCounts[index].survived, ageGroupCounts[index].total)
+      })),
+    };
+
+    this.reportCache.set(data, report);
+    return report;
+  }
+}
@@ -1,4 +1,15 @@
-import { TitanicPassenger, ProcessedPassenger } from '../types/titanic';
+import { TitanicPassenger, ProcessedPassenger, FeatureStats } from '../types/titanic';
+
+// Rare and variant titles mapped to their grouped title
+const TITLE_GROUPS = new Map<string, string>([
+  ...['Lady', 'Countess', 'Capt', 'Col', 'Don', 'Dr', 'Major', 'Rev', 'Sir', 'Jonkheer']
+    .map(title => [title, 'Other'] as [string, string]),
+  ['Mlle', 'Miss'],
+  ['Ms', 'Miss'],
+  ['Mme', 'Mrs'],
+]);
+
+const COMMON_TITLES = new Set(['Master', 'Miss', 'Mr', 'Mrs']);
 
 export class DataProcessor {
   static extractTitle(name: string): string {
@@ -8,26 +19,19 @@ export class DataProcessor {
     const title = titleMatch[1].trim();
     
     // Group rare titles
-    if (['Lady', 'Countess', 'Capt', 'Col', 'Don', 'Dr', 'Major', 'Rev', 'Sir', 'Jonkheer'].includes(title)) {
-      return 'Other';
-    }
-    if (['Mlle', 'Ms'].includes(title)) {
-      return 'Miss';
-    }
-    if (['Mme'].includes(title)) {
-      return 'Mrs';
-    }
-    
-    return title;
+    return TITLE_GROUPS.get(title) ?? title;
   }
 
-  static fillMissingAge(passengers: TitanicPassenger[]): TitanicPassenger[] {
+  static fillMissingAge(
+    passengers: TitanicPassenger[],
+    titles: string[] = passengers.map(p => this.extractTitle(p.Name))
+  ): TitanicPassenger[] {
     // Calculate median age by title and class
     const ageByTitleClass = new Map<string, number[]>();
     
-    passengers.forEach(p => {
+    passengers.forEach((p, index) => {
       if (p.Age !== null && !isNaN(p.Age)) {
-        const title = this.extractTitle(p.Name);
+        const title = titles[index];
         const key = `${title}_${p.Pclass}`;
         if (!ageByTitleClass.has(key)) {
           ageByTitleClass.set(key, []);
@@ -45,9 +49,9 @@ export class DataProcessor {
     });
 
     // Fill missing ages
-    return passengers.map(p => {
+    return passengers.map((p, index) => {
       if (p.Age === null || isNaN(p.Age)) {
-        const title = this.extractTitle(p.Name);
+        const title = titles[index];
         const key = `${title}_${p.Pclass}`;
         const medianAge = medianAges.get(key) || 29; // Overall median
         return { ...p, Age: medianAge };
@@ -86,12 +90,15 @@ export class DataProcessor {
   }
 
   static processPassengers(passengers: TitanicPassenger[]): ProcessedPassenger[] {
+    // Extract titles once and reuse them for imputation and encoding
+    const titles = passengers.map(p => this.extractTitle(p.Name));
+
     // Fill missing values
-    let processed = this.fillMissingAge(passengers);
+    let processed = this.fillMissingAge(passengers, titles);
     processed = this.fillMissingFare(processed);
 
-    return processed.map(p => {
-      const title = this.extractTitle(p.Name);
+    return processed.map((p, index) => {
+      const title = titles[index];
       const familySize = p.SibSp + p.Parch + 1;
       
       return {
@@ -111,32 +118,55 @@ export class DataProcessor {
         Title_Miss: title === 'Miss' ? 1 : 0,
         Title_Mr: title === 'Mr' ? 1 : 0,
         Title_Mrs: title === 'Mrs' ? 1 : 0,
-        Title_Other: !['Master', 'Miss', 'Mr', 'Mrs'].includes(title) ? 1 : 0,
+        Title_Other: !COMMON_TITLES.has(title) ? 1 : 0,
       };
     });
   }
 
-  static normalizeFeatures(data: ProcessedPassenger[]): ProcessedPassenger[] {
+  static getFeatureStats(data: ProcessedPassenger[]): FeatureStats {
     const features = ['Age', 'Fare'];
-    const stats = new Map<string, { mean: number; std: number }>();
+    const stats: FeatureStats = new Map();
 
-    // Calculate mean and std for each feature
+    // Calculate mean and std for each feature in a single pass (Welford)
     features.forEach(feature => {
-      const values = data.map(d => (d as any)[feature]);
-      const mean = values.reduce((a, b) => a + b, 0) / values.length;
-      const variance = values.reduce((a, b) => a + Math.pow(b - mean, 2), 0) / values.length;
-      const std = Math.sqrt(variance);
+      let mean = 0;
+      let sumSquares = 0;
+      data.forEach((d, index) => {
+        const value = (d as any)[feature];
+        const delta = value - mean;
+        mean += delta / (index + 1);
+        sumSquares += delta * (value - mean);
+      });
+      const std = Math.sqrt(sumSquares / data.length);
       stats.set(feature, { mean, std });
     });
 
+    return stats;
+  }
+
+  static normalizeFeatures(
+    data: ProcessedPassenger[],
+    stats: FeatureStats = this.getFeatureStats(data)
+  ): ProcessedPassenger[] {
     // Normalize
     return data.map(d => {
       const normalized = { ...d };
-      features.forEach(feature => {
-        const { mean, std } = stats.get(feature)!;
+      stats.forEach(({ mean, std }, feature) => {
         (normalized as any)[feature] = std > 0 ? ((d as any)[feature] - mean) / std : 0;
       });
       return normalized;
     });
   }
+
+  // Shared preprocessing pipeline for training and prediction. Pass the
+  // training set's stats when preparing new passengers so they are scaled
+  // the same way the model saw during training.
+  static preparePassengers(
+    passengers: TitanicPassenger[],
+    stats?: FeatureStats
+  ): { data: ProcessedPassenger[]; stats: FeatureStats } {
+    const processed = this.processPassengers(passengers);
+    const featureStats = stats ?? this.getFeatureStats(processed);
+    return { data: this.normalizeFeatures(processed, featureStats), stats: featureStats };
+  }
 }
@@ -0,0 +1,9 @@
+import { ForestJob, trainForestTrees } from './mlModels';
+
+// Worker globals are typed as Window under the DOM lib
+const ctx = self as unknown as Worker;
+
+ctx.onmessage = (event: MessageEvent<ForestJob>) => {
+  const { data, numTrees, maxDepth, minSamplesSplit } = event.data;
+  ctx.postMessage(trainForestTrees(data, numTrees, maxDepth, minSamplesSplit));
+};
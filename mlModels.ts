@@ -31,21 +31,34 @@ export class LogisticRegression {
   }
 
   train(data: ProcessedPassenger[]): void {
-    const features = data.map(d => this.getFeatures(d));
-    const labels = data.map(d => d.Survived!);
     const m = data.length;
-    const n = features[0].length;
+    const n = this.getFeatures(data[0]).length;
+
+    // Pack features into a flat row-major Float64Array and labels into a
+    // Uint8Array so each gradient step streams compact typed memory
+    const features = new Float64Array(m * n);
+    const labels = new Uint8Array(m);
+    data.forEach((d, i) => {
+      features.set(this.getFeatures(d), i * n);
+      labels[i] = d.Survived!;
+    });
 
     // Initialize weights
     this.weights = new Array(n).fill(0);
     this.bias = 0;
 
+    const predictions = new Float64Array(m);
+
     // Gradient descent
     for (let iter = 0; iter < this.iterations; iter++) {
-      const predictions = features.map(f => {
-        const z = f.reduce((sum, val, i) => sum + val * this.weights[i], this.bias);
-        return this.sigmoid(z);
-      });
+      for (let i = 0; i < m; i++) {
+        const offset = i * n;
+        let z = this.bias;
+        for (let j = 0; j < n; j++) {
+          z += features[offset + j] * this.weights[j];
+        }
+        predictions[i] = this.sigmoid(z);
+      }
 
       // Calculate gradients
       const dw = new Array(n).fill(0);
@@ -53,9 +66,10 @@ export class LogisticRegression {
 
       for (let i = 0; i < m; i++) {
         const error = predictions[i] - labels[i];
+        const offset = i * n;
         db += error;
         for (let j = 0; j < n; j++) {
-          dw[j] += error * features[i][j];
+          dw[j] += error * features[offset + j];
         }
       }
 
@@ -123,20 +137,39 @@ export class RandomForest {
   private minSamplesSplit: number = 2;
 
   train(data: ProcessedPassenger[]): void {
-    this.trees = [];
-    
-    for (let i = 0; i < this.numTrees; i++) {
-      // Bootstrap sampling
-      const bootstrapData = [];
-      for (let j = 0; j < data.length; j++) {
-        const randomIndex = Math.floor(Math.random() * data.length);
-        bootstrapData.push(data[randomIndex]);
-      }
-      
-      const tree = new DecisionTree(this.maxDepth, this.minSamplesSplit);
-      tree.train(bootstrapData);
-      this.trees.push(tree);
+    this.trees = trainForestTrees(data, this.numTrees, this.maxDepth, this.minSamplesSplit)
+      .map(root => DecisionTree.fromRoot(root));
+  }
+
+  // Fit the bootstrap trees across Web Workers. The trees are independent and
+  // come back as plain TreeNode objects, so each worker builds a share of them.
+  async trainParallel(data: ProcessedPassenger[]): Promise<void> {
+    if (typeof Worker === 'undefined') {
+      this.train(data);
+      return;
     }
+
+    // Leave one core for the main thread, which trains the other models meanwhile
+    const workerCount = Math.max(1, Math.min(this.numTrees, (navigator.hardwareConcurrency || 4) - 1));
+    const shares = Array.from({ length: workerCount }, (_, i) =>
+      Math.floor(this.numTrees / workerCount) + (i < this.numTrees % workerCount ? 1 : 0)
+    );
+
+    const results = await Promise.all(shares.map(numTrees => new Promise<TreeNode[]>((resolve, reject) => {
+      const worker = new Worker(new URL('./forestWorker.ts', import.meta.url), { type: 'module' });
+      worker.onmessage = (event: MessageEvent<TreeNode[]>) => {
+        worker.terminate();
+        resolve(event.data);
+      };
+      worker.onerror = (event) => {
+        worker.terminate();
+        reject(new Error(event.message));
+      };
+      const job: ForestJob = { data, numTrees, maxDepth: this.maxDepth, minSamplesSplit: this.minSamplesSplit };
+      worker.postMessage(job);
+    })));
+
+    this.trees = results.flat().map(root => DecisionTree.fromRoot(root));
   }
 
   predict(passenger: ProcessedPassenger): PredictionResult {
@@ -188,9 +221,52 @@ export class RandomForest {
   }
 }
 
+export interface ForestJob {
+  data: ProcessedPassenger[];
+  numTrees: number;
+  maxDepth: number;
+  minSamplesSplit: number;
+}
+
+// Fits numTrees trees on bootstrap samples of data and returns their roots.
+// Shared by RandomForest.train and the forest worker.
+export function trainForestTrees(
+  data: ProcessedPassenger[],
+  numTrees: number,
+  maxDepth: number,
+  minSamplesSplit: number
+): TreeNode[] {
+  const roots: TreeNode[] = [];
+  
+  for (let i = 0; i < numTrees; i++) {
+    // Bootstrap sampling
+    const bootstrapData = [];
+    for (let j = 0; j < data.length; j++) {
+      const randomIndex = Math.floor(Math.random() * data.length);
+      bootstrapData.push(data[randomIndex]);
+    }
+    
+    const tree = new DecisionTree(maxDepth, minSamplesSplit);
+    tree.train(bootstrapData);
+    roots.push(tree.getRoot()!);
+  }
+  
+  return roots;
+}
+
 class DecisionTree {
   private root: TreeNode | null = null;
 
+  static fromRoot(root: TreeNode): DecisionTree {
+    const tree = new DecisionTree();
+    tree.root = root;
+    return tree;
+  }
+
+  getRoot(): TreeNode | null {
+    return this.root;
+  }
+
   constructor(
     private maxDepth: number = 10,
     private minSamplesSplit: number = 2
@@ -216,63 +292,57 @@ class DecisionTree {
     ];
   }
 
-  private calculateGini(labels: number[]): number {
-    if (labels.length === 0) return 0;
-    
-    const counts = labels.reduce((acc, label) => {
-      acc[label] = (acc[label] || 0) + 1;
-      return acc;
-    }, {} as Record<number, number>);
+  private calculateGini(positive: number, total: number): number {
+    if (total === 0) return 0;
     
-    let gini = 1;
-    for (const count of Object.values(counts)) {
-      const prob = count / labels.length;
-      gini -= prob * prob;
-    }
-    
-    return gini;
+    const prob = positive / total;
+    return 1 - prob * prob - (1 - prob) * (1 - prob);
   }
 
   private findBestSplit(data: ProcessedPassenger[]): { featureIndex: number; threshold: number; gain: number } | null {
     if (data.length < this.minSamplesSplit) return null;
     
     const features = data.map(d => this.getFeatures(d));
-    const labels = data.map(d => d.Survived!);
+    const labels = Uint8Array.from(data, d => (d.Survived === 1 ? 1 : 0));
     const numFeatures = features[0].length;
+    const total = labels.length;
+    const totalPositive = labels.reduce((sum, label) => sum + label, 0);
     
     let bestGain = 0;
     let bestFeatureIndex = -1;
     let bestThreshold = 0;
     
-    const parentGini = this.calculateGini(labels);
+    const parentGini = this.calculateGini(totalPositive, total);
+    const values = new Float64Array(total);
+    const order = new Uint32Array(total);
     
     for (let featureIndex = 0; featureIndex < numFeatures; featureIndex++) {
-      const values = features.map(f => f[featureIndex]);
-      const uniqueValues = [...new Set(values)].sort((a, b) => a - b);
+      for (let i = 0; i < total; i++) {
+        values[i] = features[i][featureIndex];
+        order[i] = i;
+      }
+      order.sort((a, b) => values[a] - values[b]);
       
-      for (let i = 0; i < uniqueValues.length - 1; i++) {
-        const threshold = (uniqueValues[i] + uniqueValues[i + 1]) / 2;
-        
-        const leftIndices: number[] = [];
-        const rightIndices: number[] = [];
-        
-        values.forEach((value, index) => {
-          if (value <= threshold) {
-            leftIndices.push(index);
-          } else {
-            rightIndices.push(index);
-          }
-        });
+      // Sweep thresholds in ascending order, moving one sample at a time to
+      // the left side and updating the class counts incrementally
+      let leftCount = 0;
+      let leftPositive = 0;
+      
+      for (let i = 0; i < total - 1; i++) {
+        leftCount++;
+        leftPositive += labels[order[i]];
         
-        if (leftIndices.length === 0 || rightIndices.length === 0) continue;
+        const value = values[order[i]];
+        const nextValue = values[order[i + 1]];
+        if (value === nextValue) continue;
         
-        const leftLabels = leftIndices.map(i => labels[i]);
-        const rightLabels = rightIndices.map(i => labels[i]);
+        const threshold = (value + nextValue) / 2;
+        const rightCount = total - leftCount;
         
-        const leftGini = this.calculateGini(leftLabels);
-        const rightGini = this.calculateGini(rightLabels);
+        const leftGini = this.calculateGini(leftPositive, leftCount);
+        const rightGini = this.calculateGini(totalPositive - leftPositive, rightCount);
         
-        const weightedGini = (leftLabels.length * leftGini + rightLabels.length * rightGini) / labels.length;
+        const weightedGini = (leftCount * leftGini + rightCount * rightGini) / total;
         const gain = parentGini - weightedGini;
         
         if (gain > bestGain) {
@@ -339,7 +409,7 @@ class DecisionTree {
       return { survived: false, probability: 0, confidence: 'Low' };
     }
     
-    const result = this.predictNode(this.root, passenger);
+    const result = this.predictNode(this.root, this.getFeatures(passenger));
     
     let confidence: 'Low' | 'Medium' | 'High';
     if (result.probability > 0.8 || result.probability < 0.2) {
@@ -357,21 +427,17 @@ class DecisionTree {
     };
   }
 
-  private predictNode(node: TreeNode, passenger: ProcessedPassenger): { prediction: number; probability: number } {
-    if (node.isLeaf) {
-      return { prediction: node.prediction!, probability: node.probability! };
+  private predictNode(node: TreeNode, features: number[]): { prediction: number; probability: number } {
+    // Walk down the tree reusing the feature vector extracted once by predict
+    while (!node.isLeaf) {
+      node = features[node.featureIndex!] <= node.threshold! ? node.left! : node.right!;
     }
     
-    const features = this.getFeatures(passenger);
-    if (features[node.featureIndex!] <= node.threshold!) {
-      return this.predictNode(node.left!, passenger);
-    } else {
-      return this.predictNode(node.right!, passenger);
-    }
+    return { prediction: node.prediction!, probability: node.probability! };
   }
 }
 
-interface TreeNode {
+export interface TreeNode {
   isLeaf: boolean;
   featureIndex?: number;
   threshold?: number;
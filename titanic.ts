@@ -33,6 +33,8 @@ export interface ProcessedPassenger {
   Title_Other: number;
 }
 
+export type FeatureStats = Map<string, { mean: number; std: number }>;
+
 export interface ModelMetrics {
   accuracy: number;
   precision: number;
@@ -46,3 +48,18 @@ export interface PredictionResult {
   probability: number;
   confidence: 'Low' | 'Medium' | 'High';
 }
+
+export interface SurvivalBreakdown {
+  total: number;
+  survived: number;
+  rate: string;
+}
+
+export interface SurvivalReport {
+  totalPassengers: number;
+  survivedCount: number;
+  survivalRate: string;
+  classSurvival: (SurvivalBreakdown & { class: number })[];
+  genderSurvival: (SurvivalBreakdown & { gender: string })[];
+  ageGroups: (SurvivalBreakdown & { name: string; min: number; max: number })[];
+}